@@ -122,14 +122,15 @@ class ConfidenceEstimatorAgent:
         """Calculate penalties for high-risk assumptions."""
         penalties = []
 
+        # Lowercase the flagged assumptions once rather than per (assumption, flag) pair
+        flagged_lower = [hra.lower() for hra in devils_advocate_output.high_risk_assumptions]
+
         # Check which of Proposer's assumptions were flagged as high-risk by Devil's Advocate
         for assumption in proposer_output.assumptions:
             if assumption.risk_level == "high":
                 # Check if flagged by Devil's Advocate
-                flagged = any(
-                    assumption.statement.lower() in hra.lower()
-                    for hra in devils_advocate_output.high_risk_assumptions
-                )
+                statement_lower = assumption.statement.lower()
+                flagged = any(statement_lower in hra for hra in flagged_lower)
 
                 if flagged:
                     # High-risk assumption flagged by both: -12%
@@ -6,6 +6,7 @@ from pydantic import Field
 import os
 from dotenv import load_dotenv
 
+from src.config import sampling_params
 from src.models.schemas import ContextAnalysis
 
 load_dotenv()
@@ -66,6 +67,7 @@ class ContextAnalyzerAgent:
 
         self.client = instructor.from_openai(OpenAI(api_key=api_key))
         self.model = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
+        self.sampling_params = sampling_params()
 
     def _classify_decision_type(self, decision: str, context: str = "") -> str:
         """Classify the decision type based on decision statement and context."""
@@ -85,7 +87,7 @@ Return ONLY the decision type (one word: launch, pricing, hiring, technical, or
             model=self.model,
             messages=[{"role": "user", "content": prompt}],
             response_model=None,
-            temperature=0
+            **self.sampling_params
         )
 
         decision_type = response.choices[0].message.content.strip().lower()
@@ -118,7 +120,7 @@ Example: ["system stability verification", "rollback plan"]"""
             model=self.model,
             messages=[{"role": "user", "content": prompt}],
             response_model=None,
-            temperature=0
+            **self.sampling_params
         )
 
         # Parse response - expecting JSON array
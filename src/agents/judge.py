@@ -4,6 +4,7 @@ from langfuse.openai import OpenAI  # Langfuse wrapper for automatic tracking
 import os
 from dotenv import load_dotenv
 
+from src.config import sampling_params
 from src.models.schemas import JudgeOutput, ContextAnalysis, ProposerOutput, DevilsAdvocateOutput
 
 load_dotenv()
@@ -20,6 +21,7 @@ class JudgeAgent:
 
         self.client = instructor.from_openai(OpenAI(api_key=api_key))
         self.model = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
+        self.sampling_params = sampling_params()
 
     def evaluate(
         self,
@@ -71,7 +73,7 @@ CRITICAL RULES:
                 }
             ],
             response_model=JudgeOutput,
-            temperature=0
+            **self.sampling_params
         )
 
         return response
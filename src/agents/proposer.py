@@ -4,6 +4,7 @@ from langfuse.openai import OpenAI  # Langfuse wrapper for automatic tracking
 import os
 from dotenv import load_dotenv
 
+from src.config import sampling_params
 from src.models.schemas import ProposerOutput, ContextAnalysis
 
 load_dotenv()
@@ -20,6 +21,7 @@ class ProposerAgent:
 
         self.client = instructor.from_openai(OpenAI(api_key=api_key))
         self.model = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
+        self.sampling_params = sampling_params()
 
     def propose(self, decision: str, context: str, context_analysis: ContextAnalysis) -> ProposerOutput:
         """
@@ -58,7 +60,7 @@ CRITICAL RULES:
                 }
             ],
             response_model=ProposerOutput,
-            temperature=0
+            **self.sampling_params
         )
 
         return response
@@ -0,0 +1,42 @@
+"""Settings read from the environment, shared by the agents and services."""
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+def env_int(name: str, default: Optional[int], minimum: Optional[int] = None) -> Optional[int]:
+    """Read an integer setting, falling back to the default on a missing or bad value.
+
+    Values below `minimum`, when given, count as bad.
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        logger.warning("Ignoring non-integer %s=%r; using %s", name, value, default)
+        return default
+    if minimum is not None and parsed < minimum:
+        logger.warning("Ignoring %s=%d below %d; using %s", name, parsed, minimum, default)
+        return default
+    return parsed
+
+
+def sampling_params() -> Dict[str, Any]:
+    """Sampling arguments for every agent's chat completion call.
+
+    Always temperature=0; OPENAI_SEED, when set, is passed as the seed so repeated
+    calls are reproducible. Without it no seed is sent at all.
+    """
+    params: Dict[str, Any] = {"temperature": 0}
+    seed = env_int("OPENAI_SEED", None)
+    if seed is not None:
+        params["seed"] = seed
+    return params
@@ -1,7 +1,7 @@
 """Service layer for decision evaluation operations."""
 from datetime import datetime
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 import json
 
 from src.models.schemas import (
@@ -9,15 +9,15 @@ from src.models.schemas import (
     VersionComparison, VersionSummary, RiskDelta
 )
 from src.models.database import DecisionRunDB
-from src.services.workflow import DecisionWorkflow
+from src.services.workflow import DecisionWorkflow, get_workflow
 
 
 class DecisionService:
     """Service for managing decision evaluations."""
 
-    def __init__(self):
-        """Initialize decision service with workflow."""
-        self.workflow = DecisionWorkflow()
+    def __init__(self, workflow: Optional[DecisionWorkflow] = None):
+        """Initialize decision service with the given workflow, or the shared one."""
+        self.workflow = workflow if workflow is not None else get_workflow()
 
     def _generate_decision_id(self, decision_type: str) -> str:
         """Generate unique decision ID in format: dec_YYYYMMDD_<type>"""
@@ -27,23 +27,21 @@ class DecisionService:
         time_str = timestamp.strftime("%H%M%S")
         return f"dec_{date_str}_{decision_type}_{time_str}"
 
-    def _get_next_version(self, db: Session, decision_id: str) -> int:
-        """Get the next version number for a decision ID."""
-        latest = db.query(DecisionRunDB).filter(
+    def _get_latest_record(self, db: Session, decision_id: str) -> Optional[DecisionRunDB]:
+        """Get the highest-version record for a decision ID (an index seek on decision_id, version)."""
+        return db.query(DecisionRunDB).filter(
             DecisionRunDB.decision_id == decision_id
         ).order_by(DecisionRunDB.version.desc()).first()
 
-        if latest:
-            return latest.version + 1
-        return 1
-
-    def evaluate_decision(self, decision_input: DecisionInput, db: Session) -> DecisionResponse:
+    def evaluate_decision(self, decision_input: DecisionInput, db: Session, commit: bool = True) -> DecisionResponse:
         """
         Evaluate a decision and store the result.
 
         Args:
             decision_input: The decision to evaluate
             db: Database session
+            commit: Commit the new record; if False it is only flushed, leaving the
+                commit to the caller (e.g. to store several versions in one transaction)
 
         Returns:
             DecisionResponse with evaluation results
@@ -95,8 +93,10 @@ class DecisionService:
             output_json=decision_run.model_dump_json()
         )
         db.add(db_record)
-        db.commit()
-        db.refresh(db_record)
+        if commit:
+            db.commit()
+        else:
+            db.flush()
 
         # Return response
         return DecisionResponse(
@@ -145,7 +145,8 @@ class DecisionService:
         self,
         decision_id: str,
         decision_input: DecisionInput,
-        db: Session
+        db: Session,
+        commit: bool = True
     ) -> DecisionResponse:
         """
         Re-evaluate an existing decision with new context.
@@ -154,6 +155,7 @@ class DecisionService:
             decision_id: The decision ID to re-evaluate
             decision_input: Updated decision input (must match original decision statement)
             db: Database session
+            commit: Commit the new record; if False it is only flushed (see evaluate_decision)
 
         Returns:
             DecisionResponse with new version
@@ -162,9 +164,7 @@ class DecisionService:
             ValueError: If decision_id not found or decision statement doesn't match
         """
         # Get the latest version to verify decision exists and get decision statement
-        latest_record = db.query(DecisionRunDB).filter(
-            DecisionRunDB.decision_id == decision_id
-        ).order_by(DecisionRunDB.version.desc()).first()
+        latest_record = self._get_latest_record(db, decision_id)
 
         if not latest_record:
             raise ValueError(f"Decision {decision_id} not found")
@@ -179,8 +179,8 @@ class DecisionService:
                 f"Expected: '{latest_run.decision}', Got: '{decision_input.decision}'"
             )
 
-        # Auto-increment version number first for tracing
-        next_version = self._get_next_version(db, decision_id)
+        # Auto-increment version number first for tracing (from the record loaded above)
+        next_version = latest_record.version + 1
 
         # Run workflow with updated context (fresh evaluation, no memory from previous)
         final_state = self.workflow.run(
@@ -224,8 +224,10 @@ class DecisionService:
             output_json=decision_run.model_dump_json()
         )
         db.add(db_record)
-        db.commit()
-        db.refresh(db_record)
+        if commit:
+            db.commit()
+        else:
+            db.flush()
 
         # Return response
         return DecisionResponse(
@@ -245,9 +247,7 @@ class DecisionService:
 
     def get_latest_decision(self, decision_id: str, db: Session) -> DecisionResponse:
         """Retrieve the latest version of a decision evaluation."""
-        latest_record = db.query(DecisionRunDB).filter(
-            DecisionRunDB.decision_id == decision_id
-        ).order_by(DecisionRunDB.version.desc()).first()
+        latest_record = self._get_latest_record(db, decision_id)
 
         if not latest_record:
             raise ValueError(f"Decision {decision_id} not found")
@@ -313,16 +313,15 @@ class DecisionService:
         Raises:
             ValueError: If either version not found
         """
-        # Retrieve both versions
-        v1_record = db.query(DecisionRunDB).filter(
+        # Retrieve both versions in one query
+        records = db.query(DecisionRunDB).filter(
             DecisionRunDB.decision_id == decision_id,
-            DecisionRunDB.version == v1
-        ).first()
+            DecisionRunDB.version.in_((v1, v2))
+        ).all()
+        records_by_version = {record.version: record for record in records}
 
-        v2_record = db.query(DecisionRunDB).filter(
-            DecisionRunDB.decision_id == decision_id,
-            DecisionRunDB.version == v2
-        ).first()
+        v1_record = records_by_version.get(v1)
+        v2_record = records_by_version.get(v2)
 
         if not v1_record:
             raise ValueError(f"Decision {decision_id} version {v1} not found")
@@ -355,13 +354,16 @@ class DecisionService:
             opportunity_cost=(v2_risk.opportunity_cost if v2_risk else 0) - (v1_risk.opportunity_cost if v1_risk else 0)
         )
 
-        # Determine which context items were resolved
-        v1_missing = set(v1_run.context_analysis.missing_context)
-        v2_missing = set(v2_run.context_analysis.missing_context)
+        # Determine which context items were resolved; set lookups keep this linear,
+        # and walking the de-duplicated lists keeps the analyzer's ordering stable
+        v1_missing_list = list(dict.fromkeys(v1_run.context_analysis.missing_context))
+        v2_missing_list = list(dict.fromkeys(v2_run.context_analysis.missing_context))
+        v1_missing = frozenset(v1_missing_list)
+        v2_missing = frozenset(v2_missing_list)
 
-        resolved_missing_context = list(v1_missing - v2_missing)
-        remaining_missing_context = list(v2_missing & v1_missing)
-        new_missing_context = list(v2_missing - v1_missing)
+        resolved_missing_context = [item for item in v1_missing_list if item not in v2_missing]
+        remaining_missing_context = [item for item in v2_missing_list if item in v1_missing]
+        new_missing_context = [item for item in v2_missing_list if item not in v1_missing]
 
         return VersionComparison(
             decision_id=decision_id,
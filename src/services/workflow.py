@@ -1,9 +1,14 @@
 """LangGraph workflow orchestration for decision evaluation."""
-from typing import TypedDict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, TypedDict, Optional
+import logging
+import os
+import threading
 import time
 from langgraph.graph import StateGraph, END
 
-from src.models.schemas import ContextAnalysis, ProposerOutput, DevilsAdvocateOutput, JudgeOutput, ConfidenceOutput
+from src.config import env_int
+from src.models.schemas import DecisionInput, ContextAnalysis, ProposerOutput, DevilsAdvocateOutput, JudgeOutput, ConfidenceOutput
 from src.agents.context_analyzer import ContextAnalyzerAgent
 from src.agents.proposer import ProposerAgent
 from src.agents.devils_advocate import DevilsAdvocateAgent
@@ -11,25 +16,60 @@ from src.agents.judge import JudgeAgent
 from src.agents.confidence_estimator import ConfidenceEstimatorAgent
 from src.observability.langfuse_client import get_langfuse
 
+logger = logging.getLogger(__name__)
 
-class DecisionState(TypedDict):
-    """State schema for decision evaluation workflow."""
+# Upper bound on concurrent runs in DecisionWorkflow.run_batch (at least one)
+MAX_BATCH_WORKERS = max(1, env_int("WORKFLOW_BATCH_WORKERS", 4))
+
+# Budget for strings/lists embedded in Langfuse span and trace payloads
+MAX_TRACE_ITEMS = env_int("LANGFUSE_MAX_IO_ITEMS", 20, minimum=0)
+MAX_TRACE_CHARS = env_int("LANGFUSE_MAX_IO_CHARS", 2000, minimum=0)
+
+
+def _trunc(obj: Any, max_items: int = MAX_TRACE_ITEMS, max_chars: int = MAX_TRACE_CHARS) -> Any:
+    """Recursively trim strings and lists in a tracing payload to the configured budget."""
+    if isinstance(obj, str):
+        return obj if len(obj) <= max_chars else obj[:max_chars] + "...[truncated]"
+    if isinstance(obj, dict):
+        return {key: _trunc(value, max_items, max_chars) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        trimmed = [_trunc(item, max_items, max_chars) for item in obj[:max_items]]
+        if len(obj) > max_items:
+            # Mark dropped items so a trimmed list does not read as complete
+            trimmed.append(f"...(+{len(obj) - max_items} more)")
+        return trimmed
+    return obj
+
+
+class _DecisionStateInput(TypedDict):
+    """Keys supplied by the caller when the workflow starts."""
     decision: str
     context: Optional[str]
-    context_analysis: Optional[ContextAnalysis]
-    proposer_output: Optional[ProposerOutput]
-    devils_advocate_output: Optional[DevilsAdvocateOutput]
-    judge_output: Optional[JudgeOutput]
-    confidence_output: Optional[ConfidenceOutput]
-    final_recommendation: Optional[str]
     # Tracing metadata
     trace_id: Optional[str]
     decision_id: Optional[str]
     version: Optional[int]
 
 
+class DecisionState(_DecisionStateInput, total=False):
+    """State schema for decision evaluation workflow.
+
+    Agent outputs are absent from the initial state; each node adds its own.
+    """
+    context_analysis: ContextAnalysis
+    proposer_output: ProposerOutput
+    devils_advocate_output: DevilsAdvocateOutput
+    judge_output: JudgeOutput
+    confidence_output: ConfidenceOutput
+    final_recommendation: str
+
+
 class DecisionWorkflow:
-    """LangGraph-based workflow for decision evaluation."""
+    """LangGraph-based workflow for decision evaluation.
+
+    Instances hold no per-run state, so one instance can serve concurrent
+    run() calls; use get_workflow() to share it across the process.
+    """
 
     def __init__(self):
         """Initialize workflow with agents."""
@@ -40,9 +80,27 @@ class DecisionWorkflow:
         self.confidence_estimator = ConfidenceEstimatorAgent()
         self.graph = self._build_graph()
 
+        # Opt-in: prime the OpenAI connection pools off the request path. httpx closes
+        # idle connections after ~5s, so this only helps a run that starts soon after
+        if os.getenv("OPENAI_WARMUP", "false").lower() == "true":
+            threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self) -> None:
+        """Open a connection on each distinct OpenAI client so the first run skips TLS setup."""
+        seen = set()
+        for agent in (self.context_analyzer, self.proposer, self.devils_advocate, self.judge):
+            client = getattr(getattr(agent, "client", None), "client", None)
+            if client is None or id(client) in seen:
+                continue
+            seen.add(id(client))
+            try:
+                client.models.list()
+            except Exception as e:
+                logger.debug("OpenAI warmup request failed: %s", e)
+
     def _analyze_context(self, state: DecisionState) -> DecisionState:
         """Node: Run Context Analyzer."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         langfuse = get_langfuse()
 
         # Create span if tracing is enabled
@@ -51,10 +109,10 @@ class DecisionWorkflow:
             span = langfuse.span(
                 trace_id=state["trace_id"],
                 name="context_analyzer",
-                input={
+                input=_trunc({
                     "decision": state["decision"],
                     "context": state.get("context", "")
-                },
+                }),
                 metadata={"agent": "context_analyzer", "prompt_version": "v1.0"}
             )
 
@@ -67,13 +125,13 @@ class DecisionWorkflow:
 
         # Update span with output
         if span:
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             span.end(
-                output={
+                output=_trunc({
                     "decision_type": context_analysis.decision_type,
                     "completeness_score": context_analysis.completeness_score,
                     "missing_context": context_analysis.missing_context
-                },
+                }),
                 metadata={"latency_ms": latency_ms}
             )
 
@@ -81,7 +139,7 @@ class DecisionWorkflow:
 
     def _propose_recommendation(self, state: DecisionState) -> DecisionState:
         """Node: Run Proposer Agent."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         langfuse = get_langfuse()
 
         # Create span if tracing is enabled
@@ -90,9 +148,8 @@ class DecisionWorkflow:
             span = langfuse.span(
                 trace_id=state["trace_id"],
                 name="proposer",
+                # decision/context are already on the parent trace input
                 input={
-                    "decision": state["decision"],
-                    "context": state.get("context", ""),
                     "completeness_score": state["context_analysis"].completeness_score
                 },
                 metadata={"agent": "proposer", "prompt_version": "v1.0"}
@@ -108,13 +165,13 @@ class DecisionWorkflow:
 
         # Update span with output
         if span:
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             span.end(
-                output={
+                output=_trunc({
                     "recommendation": proposer_output.recommendation,
                     "confidence": proposer_output.confidence,
                     "assumptions_count": len(proposer_output.assumptions)
-                },
+                }),
                 metadata={"latency_ms": latency_ms}
             )
 
@@ -122,7 +179,7 @@ class DecisionWorkflow:
 
     def _critique_recommendation(self, state: DecisionState) -> DecisionState:
         """Node: Run Devil's Advocate Agent."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         langfuse = get_langfuse()
 
         # Create span if tracing is enabled
@@ -131,11 +188,10 @@ class DecisionWorkflow:
             span = langfuse.span(
                 trace_id=state["trace_id"],
                 name="devils_advocate",
-                input={
-                    "decision": state["decision"],
+                input=_trunc({
                     "proposer_recommendation": state["proposer_output"].recommendation,
                     "proposer_confidence": state["proposer_output"].confidence
-                },
+                }),
                 metadata={"agent": "devils_advocate", "prompt_version": "v1.0"}
             )
 
@@ -150,7 +206,7 @@ class DecisionWorkflow:
 
         # Update span with output
         if span:
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             span.end(
                 output={
                     "counterarguments_count": len(devils_advocate_output.counterarguments),
@@ -164,7 +220,7 @@ class DecisionWorkflow:
 
     def _evaluate_reasoning(self, state: DecisionState) -> DecisionState:
         """Node: Run Judge Agent."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         langfuse = get_langfuse()
 
         # Create span if tracing is enabled
@@ -174,7 +230,6 @@ class DecisionWorkflow:
                 trace_id=state["trace_id"],
                 name="judge",
                 input={
-                    "decision": state["decision"],
                     "proposer_confidence": state["proposer_output"].confidence,
                     "completeness_score": state["context_analysis"].completeness_score
                 },
@@ -193,7 +248,7 @@ class DecisionWorkflow:
 
         # Update span with output
         if span:
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             span.end(
                 output={
                     "proposer_strength": judge_output.proposer_strength,
@@ -208,7 +263,7 @@ class DecisionWorkflow:
 
     def _estimate_confidence(self, state: DecisionState) -> DecisionState:
         """Node: Run Confidence Estimator Agent."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         langfuse = get_langfuse()
 
         # Create span if tracing is enabled
@@ -245,34 +300,26 @@ class DecisionWorkflow:
 
         # Update span with output and log custom metrics
         if span:
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             span.end(
-                output={
+                output=_trunc({
                     "adjusted_confidence": confidence_output.adjusted_confidence,
                     "confidence_delta": confidence_output.delta,
                     "penalties_count": len(confidence_output.penalties),
                     "final_recommendation": final_recommendation.split("\n")[0]  # First line only
-                },
+                }),
                 metadata={"latency_ms": latency_ms}
             )
 
-            # Log custom metrics/scores
+            # Log custom metrics/scores (normalized to 0-1; delta can be negative)
             if state.get("trace_id"):
-                langfuse.score(
-                    trace_id=state["trace_id"],
-                    name="context_completeness",
-                    value=state["context_analysis"].completeness_score / 100.0  # Normalize to 0-1
-                )
-                langfuse.score(
-                    trace_id=state["trace_id"],
-                    name="adjusted_confidence",
-                    value=confidence_output.adjusted_confidence / 100.0  # Normalize to 0-1
-                )
-                langfuse.score(
-                    trace_id=state["trace_id"],
-                    name="confidence_delta",
-                    value=confidence_output.delta / 100.0  # Can be negative
+                scores = (
+                    ("context_completeness", state["context_analysis"].completeness_score),
+                    ("adjusted_confidence", confidence_output.adjusted_confidence),
+                    ("confidence_delta", confidence_output.delta),
                 )
+                for name, value in scores:
+                    langfuse.score(trace_id=state["trace_id"], name=name, value=value / 100.0)
 
         return state
 
@@ -319,6 +366,7 @@ class DecisionWorkflow:
             Final state with all agent outputs
         """
         langfuse = get_langfuse()
+        trace = None
         trace_id = None
 
         # Create parent trace if Langfuse is enabled
@@ -332,22 +380,16 @@ class DecisionWorkflow:
             try:
                 trace = langfuse.trace(
                     name="decision_evaluation",
-                    input={"decision": decision, "context": context},
+                    input=_trunc({"decision": decision, "context": context}),
                     metadata=metadata
                 )
                 trace_id = trace.id
             except Exception as e:
-                print(f"[WARNING] Failed to create Langfuse trace: {e}")
+                logger.warning("Failed to create Langfuse trace: %s", e)
 
         initial_state: DecisionState = {
             "decision": decision,
             "context": context,
-            "context_analysis": None,
-            "proposer_output": None,
-            "devils_advocate_output": None,
-            "judge_output": None,
-            "confidence_output": None,
-            "final_recommendation": None,
             "trace_id": trace_id,
             "decision_id": decision_id,
             "version": version
@@ -356,19 +398,54 @@ class DecisionWorkflow:
         final_state = self.graph.invoke(initial_state)
 
         # Update trace with final output
-        if langfuse and trace_id:
+        if trace is not None:
             try:
-                langfuse.trace(
-                    id=trace_id,
-                    output={
+                trace.update(
+                    output=_trunc({
                         "final_recommendation": final_state.get("final_recommendation"),
                         "adjusted_confidence": final_state.get("confidence_output").adjusted_confidence if final_state.get("confidence_output") else None,
                         "context_completeness": final_state.get("context_analysis").completeness_score if final_state.get("context_analysis") else None
-                    }
+                    })
                 )
                 # Flush to ensure data is sent
                 langfuse.flush()
             except Exception as e:
-                print(f"[WARNING] Failed to update Langfuse trace: {e}")
+                logger.warning("Failed to update Langfuse trace: %s", e)
 
         return final_state
+
+    def run_batch(self, decisions: List[DecisionInput]) -> List[DecisionState]:
+        """
+        Execute the workflow for several decisions concurrently.
+
+        Runs share this instance's agents, so their LLM calls reuse the same
+        HTTP connection pools while waiting on the network in parallel.
+
+        Args:
+            decisions: Decisions to evaluate
+
+        Returns:
+            Final states, in the same order as the input decisions
+        """
+        if not decisions:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(len(decisions), MAX_BATCH_WORKERS)) as executor:
+            return list(executor.map(
+                lambda item: self.run(decision=item.decision, context=item.context),
+                decisions
+            ))
+
+
+_workflow: Optional[DecisionWorkflow] = None
+_workflow_lock = threading.Lock()
+
+
+def get_workflow() -> DecisionWorkflow:
+    """Get the process-wide DecisionWorkflow, creating it on first use."""
+    global _workflow
+    if _workflow is None:
+        with _workflow_lock:
+            if _workflow is None:
+                _workflow = DecisionWorkflow()
+    return _workflow
@@ -0,0 +1,98 @@
+"""In-memory SQLite engine that the test suite binds the app's database to."""
+from contextlib import contextmanager
+from typing import Iterator, List, Sequence
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.models.database import Base, DecisionRunDB
+from src.models.schemas import ContextAnalysis, DecisionInput, DecisionRun
+
+# One in-memory database per test process; StaticPool keeps a single connection,
+# so every session sees the same data and nothing touches ./data on disk
+test_engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
+
+
+# pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy emit BEGIN itself
+# so the conftest `db` fixture can roll back each test's commits
+@event.listens_for(test_engine, "connect")
+def _sqlite_disable_autobegin(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine, "begin")
+def _sqlite_begin(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
+# Set whenever a top-level transaction commits; the `db` fixture only releases
+# savepoints inside a rolled-back transaction, so its tests never mark the DB dirty
+_dirty = False
+
+
+@event.listens_for(test_engine, "commit")
+def _mark_dirty(connection):
+    global _dirty
+    _dirty = True
+
+
+def reset_db() -> None:
+    """Delete every row, children first; the schema itself is created once per process.
+
+    A no-op when nothing has been committed since the last reset.
+    """
+    global _dirty
+    if not _dirty:
+        return
+    with test_engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+    _dirty = False
+
+
+def seed_versions(db: Session, decision_id: str, decision: str, context_analyses: Sequence[ContextAnalysis]) -> None:
+    """Insert versions 1..N of a decision in one batch, bypassing the agent pipeline.
+
+    Each version stores only its context analysis; the agent outputs are left unset,
+    which the service treats as missing data.
+    """
+    input_json = DecisionInput(decision=decision).model_dump_json()
+    rows = []
+    for version, context_analysis in enumerate(context_analyses, start=1):
+        run = DecisionRun(
+            decision_id=decision_id,
+            version=version,
+            decision=decision,
+            context_analysis=context_analysis
+        )
+        rows.append({
+            "decision_id": decision_id,
+            "version": version,
+            "timestamp": run.timestamp,
+            "input_json": input_json,
+            "output_json": run.model_dump_json()
+        })
+
+    db.bulk_insert_mappings(DecisionRunDB, rows)
+    db.commit()
+
+
+@contextmanager
+def captured_selects() -> Iterator[List[str]]:
+    """Collect the SELECT statements the test engine executes inside the block."""
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(test_engine, "before_cursor_execute", _record)
@@ -0,0 +1,77 @@
+"""Factories for the agent input models shared across test modules."""
+from typing import Optional, Sequence, Tuple
+
+from src.models.schemas import (
+    ContextAnalysis, ProposerOutput, DevilsAdvocateOutput,
+    Assumption, FailureScenario, RiskBreakdown
+)
+
+
+def make_context(
+    decision_type: str = "launch",
+    required: Sequence[str] = ("deployment readiness", "rollback plan"),
+    provided: Sequence[str] = ("deployment readiness",),
+    completeness_score: int = 50
+) -> ContextAnalysis:
+    """Build a ContextAnalysis; missing context is whatever is required but not provided."""
+    return ContextAnalysis(
+        decision_type=decision_type,
+        required_context=list(required),
+        provided_context=list(provided),
+        missing_context=[item for item in required if item not in provided],
+        completeness_score=completeness_score
+    )
+
+
+def make_proposer(
+    assumptions: Sequence[Tuple[str, str, str]] = (
+        ("Rollback can be done manually", "Team has rollback experience", "medium"),
+    ),
+    confidence: int = 75,
+    justification: str = "Deployment readiness is confirmed, team is prepared.",
+    recommendation: str = "proceed"
+) -> ProposerOutput:
+    """Build a ProposerOutput from (statement, basis, risk_level) assumption tuples."""
+    return ProposerOutput(
+        recommendation=recommendation,
+        assumptions=[
+            Assumption(statement=statement, basis=basis, risk_level=risk_level)
+            for statement, basis, risk_level in assumptions
+        ],
+        confidence=confidence,
+        justification=justification
+    )
+
+
+def make_advocate(
+    counterarguments: Sequence[str] = (
+        "Execution Risk: Manual rollback is unverified",
+        "Market & Customer Impact: Customers could be affected",
+        "Reputational Downside: Public failure would damage brand",
+        "Opportunity Cost: Resources could be used elsewhere"
+    ),
+    failure_scenarios: Sequence[Tuple[str, str, str]] = (
+        ("Database migration fails", "Schema incompatibility", "critical"),
+    ),
+    high_risk_assumptions: Optional[Sequence[str]] = ("Rollback can be done manually (UNVERIFIED)",),
+    risk: Tuple[int, int, int, int] = (8, 7, 6, 5)
+) -> DevilsAdvocateOutput:
+    """Build a DevilsAdvocateOutput from (description, trigger, severity) scenario tuples.
+
+    `risk` is (execution, market_customer, reputational, opportunity_cost).
+    """
+    execution, market_customer, reputational, opportunity_cost = risk
+    return DevilsAdvocateOutput(
+        counterarguments=list(counterarguments),
+        failure_scenarios=[
+            FailureScenario(description=description, trigger=trigger, impact_severity=severity)
+            for description, trigger, severity in failure_scenarios
+        ],
+        high_risk_assumptions=list(high_risk_assumptions or []),
+        risk_breakdown=RiskBreakdown(
+            execution=execution,
+            market_customer=market_customer,
+            reputational=reputational,
+            opportunity_cost=opportunity_cost
+        )
+    )
@@ -0,0 +1,37 @@
+"""Tests for environment-driven settings."""
+import sys
+
+import pytest
+
+from src.config import env_int, sampling_params
+
+
+def test_sampling_params_omit_unset_seed(monkeypatch):
+    """Test that no seed is sent when OPENAI_SEED is unset."""
+    monkeypatch.delenv("OPENAI_SEED", raising=False)
+    assert sampling_params() == {"temperature": 0}
+
+
+def test_sampling_params_pass_seed(monkeypatch):
+    """Test that OPENAI_SEED is passed through as the seed."""
+    monkeypatch.setenv("OPENAI_SEED", "7")
+    assert sampling_params() == {"temperature": 0, "seed": 7}
+
+
+def test_env_int_falls_back_on_bad_value(monkeypatch):
+    """Test that a non-integer setting falls back to the default instead of raising."""
+    monkeypatch.setenv("OPENAI_SEED", "not-a-number")
+    assert env_int("OPENAI_SEED", None) is None
+    assert sampling_params() == {"temperature": 0}
+
+
+def test_env_int_falls_back_below_minimum(monkeypatch):
+    """Test that a value below the minimum falls back to the default."""
+    monkeypatch.setenv("LANGFUSE_MAX_IO_ITEMS", "-5")
+    assert env_int("LANGFUSE_MAX_IO_ITEMS", 20, minimum=0) == 20
+    monkeypatch.setenv("LANGFUSE_MAX_IO_ITEMS", "0")
+    assert env_int("LANGFUSE_MAX_IO_ITEMS", 20, minimum=0) == 0
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -1,15 +1,28 @@
 """Tests for Langfuse integration."""
+import logging
 import sys
-import os
 
-# Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
 
 from src.observability.langfuse_client import LangfuseClient, get_langfuse
-from src.services.workflow import DecisionWorkflow
-from src.models.schemas import DecisionInput
-from src.services.decision_service import DecisionService
-from src.models.database import Base, engine, SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# test_disabled_langfuse toggles process-global LangfuseClient state; keep these
+# tests on one xdist worker (with --dist=loadgroup) so they run sequentially
+# relative to each other.
+pytestmark = pytest.mark.xdist_group("langfuse")
+
+
+@pytest.fixture(scope="module")
+def workflow_result(workflow):
+    """One workflow run (traced if Langfuse is configured), shared by the tests that inspect it."""
+    return workflow.run(
+        decision="Should we launch the new feature?",
+        context="Tests are passing",
+        decision_id="test_dec_001",
+        version=1
+    )
 
 
 def test_langfuse_client_initialization():
@@ -18,24 +31,16 @@ def test_langfuse_client_initialization():
     client = get_langfuse()
 
     if client:
-        print("\n[PASS] Langfuse client initialized successfully")
-        print(f"  Langfuse enabled: {LangfuseClient.is_enabled()}")
+        logger.debug("[PASS] Langfuse client initialized successfully")
+        logger.debug("Langfuse enabled: %s", LangfuseClient.is_enabled())
     else:
-        print("\n[INFO] Langfuse not configured (this is OK for local testing)")
-        print("  Set LANGFUSE_PUBLIC_KEY and LANGFUSE_SECRET_KEY to enable tracing")
+        logger.debug("[INFO] Langfuse not configured (this is OK for local testing)")
+        logger.debug("Set LANGFUSE_PUBLIC_KEY and LANGFUSE_SECRET_KEY to enable tracing")
 
 
-def test_workflow_with_tracing():
+def test_workflow_with_tracing(workflow_result):
     """Test that workflow runs with tracing enabled/disabled."""
-    workflow = DecisionWorkflow()
-
-    # Run workflow (will trace if Langfuse is configured)
-    result = workflow.run(
-        decision="Should we launch the new feature?",
-        context="Tests are passing",
-        decision_id="test_dec_001",
-        version=1
-    )
+    result = workflow_result
 
     # Verify workflow executed successfully
     assert result is not None
@@ -49,26 +54,27 @@ def test_workflow_with_tracing():
     # Check if trace_id was set (only if Langfuse is configured)
     if LangfuseClient.is_enabled():
         assert result.get("trace_id") is not None
-        print(f"\n[PASS] Workflow executed with tracing")
-        print(f"  Trace ID: {result.get('trace_id')}")
+        logger.debug("[PASS] Workflow executed with tracing")
+        logger.debug("Trace ID: %s", result.get('trace_id'))
     else:
-        print("\n[PASS] Workflow executed without tracing (Langfuse not configured)")
+        logger.debug("[PASS] Workflow executed without tracing (Langfuse not configured)")
 
-    print(f"  Decision ID: {result.get('decision_id')}")
-    print(f"  Version: {result.get('version')}")
-    print(f"  Context completeness: {result['context_analysis'].completeness_score}%")
-    print(f"  Adjusted confidence: {result['confidence_output'].adjusted_confidence}%")
+    logger.debug("Decision ID: %s", result.get('decision_id'))
+    logger.debug("Version: %s", result.get('version'))
+    logger.debug("Context completeness: %s%%", result['context_analysis'].completeness_score)
+    logger.debug("Adjusted confidence: %s%%", result['confidence_output'].adjusted_confidence)
 
 
-def test_disabled_langfuse():
+# Without Langfuse configured this would repeat the shared run above, so only
+# run it when there is tracing to disable
+@pytest.mark.skipif("not LangfuseClient.is_enabled()", reason="Langfuse not configured")
+def test_disabled_langfuse(workflow):
     """Test that system works correctly when Langfuse is disabled."""
     # Temporarily disable Langfuse
     original_state = LangfuseClient.is_enabled()
     LangfuseClient.disable()
 
     try:
-        workflow = DecisionWorkflow()
-
         # Run workflow without tracing
         result = workflow.run(
             decision="Should we refactor the codebase?",
@@ -83,7 +89,7 @@ def test_disabled_langfuse():
         assert result["final_recommendation"] is not None
         assert result.get("trace_id") is None  # No trace when disabled
 
-        print("\n[PASS] Workflow works correctly with Langfuse disabled")
+        logger.debug("[PASS] Workflow works correctly with Langfuse disabled")
 
     finally:
         # Restore original state
@@ -91,51 +97,47 @@ def test_disabled_langfuse():
             LangfuseClient.enable()
 
 
-def test_custom_metrics_logged():
+@pytest.mark.skipif("not LangfuseClient.is_enabled()", reason="Langfuse not configured")
+def test_custom_metrics_logged(workflow_result):
     """Test that custom metrics are logged to Langfuse."""
-    if not LangfuseClient.is_enabled():
-        print("\n[SKIP] Langfuse not configured, skipping custom metrics test")
-        return
-
-    workflow = DecisionWorkflow()
-
-    # Run workflow
-    result = workflow.run(
-        decision="Should we hire a new engineer?",
-        context="Team is overloaded. Budget approved.",
-        decision_id="test_dec_003",
-        version=1
-    )
+    result = workflow_result
 
     # Verify metrics would have been logged (scores are logged in _estimate_confidence)
     assert result["confidence_output"] is not None
     assert result["context_analysis"] is not None
 
-    print("\n[PASS] Custom metrics logged")
-    print(f"  Context completeness: {result['context_analysis'].completeness_score}/100")
-    print(f"  Adjusted confidence: {result['confidence_output'].adjusted_confidence}/100")
-    print(f"  Confidence delta: {result['confidence_output'].delta}")
+    logger.debug("[PASS] Custom metrics logged")
+    logger.debug("Context completeness: %s/100", result['context_analysis'].completeness_score)
+    logger.debug("Adjusted confidence: %s/100", result['confidence_output'].adjusted_confidence)
+    logger.debug("Confidence delta: %s", result['confidence_output'].delta)
 
 
-if __name__ == "__main__":
-    print("Running Langfuse integration tests...\n")
-    print("=" * 60)
+def test_trace_payload_truncation():
+    """Test that oversized span/trace payloads are trimmed before reaching Langfuse."""
+    from src.services.workflow import _trunc
+
+    payload = {
+        "missing_context": [f"context item {i}" for i in range(50)],
+        "context": "x" * 5000,
+        "completeness_score": 42
+    }
 
-    print("\n[Test 1/4] Testing Langfuse client initialization...")
-    test_langfuse_client_initialization()
+    trimmed = _trunc(payload, max_items=20, max_chars=2000)
 
-    print("\n[Test 2/4] Testing workflow with tracing...")
-    test_workflow_with_tracing()
+    assert len(trimmed["missing_context"]) == 21
+    assert trimmed["missing_context"][0] == "context item 0"
+    assert trimmed["missing_context"][-1] == "...(+30 more)"
+    assert trimmed["context"].startswith("x" * 2000)
+    assert len(trimmed["context"]) < len(payload["context"])
+    assert trimmed["completeness_score"] == 42
 
-    print("\n[Test 3/4] Testing disabled Langfuse...")
-    test_disabled_langfuse()
+    logger.debug("[PASS] Trace payload truncated to budget")
 
-    print("\n[Test 4/4] Testing custom metrics logging...")
-    test_custom_metrics_logged()
 
-    print("\n" + "=" * 60)
-    print("All Langfuse integration tests passed!")
-    print("=" * 60)
+if __name__ == "__main__":
+    print("Running Langfuse integration tests...\n")
+    exit_code = pytest.main([__file__, "-q"])
+
     print("\nNote: To enable full Langfuse tracing, set these environment variables:")
     print("  LANGFUSE_PUBLIC_KEY=<your-public-key>")
     print("  LANGFUSE_SECRET_KEY=<your-secret-key>")
@@ -146,3 +148,4 @@ if __name__ == "__main__":
     print("  LANGFUSE_HOST=https://cloud.langfuse.com")
     print("\nTo run self-hosted Langfuse with Docker:")
     print("  docker run -d -p 3000:3000 langfuse/langfuse")
+    sys.exit(exit_code)
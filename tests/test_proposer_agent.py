@@ -1,17 +1,17 @@
 """Tests for Proposer Agent."""
+import logging
 import sys
-import os
 
-# Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
 
-from src.agents.proposer import ProposerAgent
-from src.models.schemas import ContextAnalysis
+from src.models.schemas import ContextAnalysis, ProposerOutput
 
+logger = logging.getLogger(__name__)
 
-def test_proposer_with_low_completeness():
+
+@pytest.mark.live
+def test_proposer_with_low_completeness(proposer_agent):
     """Test that proposer generates assumptions when context is incomplete."""
-    agent = ProposerAgent()
 
     # Context analysis with low completeness
     context_analysis = ContextAnalysis(
@@ -31,7 +31,7 @@ def test_proposer_with_low_completeness():
         completeness_score=25
     )
 
-    result = agent.propose(
+    result = proposer_agent.propose(
         decision="Should we launch this week?",
         context="Auth service is stable",
         context_analysis=context_analysis
@@ -50,15 +50,14 @@ def test_proposer_with_low_completeness():
         assert len(assumption.basis) > 0
         assert assumption.risk_level in ["low", "medium", "high"]
 
-    print(f"\n[PASS] Test passed: Proposer with low completeness")
-    print(f"  Recommendation: {result.recommendation}")
-    print(f"  Assumptions: {len(result.assumptions)}")
-    print(f"  Confidence: {result.confidence}")
+    logger.debug("[PASS] Test passed: Proposer with low completeness")
+    logger.debug("Recommendation: %s", result.recommendation)
+    logger.debug("Assumptions: %s", len(result.assumptions))
+    logger.debug("Confidence: %s", result.confidence)
 
 
-def test_proposer_with_high_completeness():
+def test_proposer_with_high_completeness(proposer_agent):
     """Test that proposer has higher confidence with complete context."""
-    agent = ProposerAgent()
 
     # Context analysis with high completeness
     context_analysis = ContextAnalysis(
@@ -77,7 +76,7 @@ def test_proposer_with_high_completeness():
         completeness_score=100
     )
 
-    result = agent.propose(
+    result = proposer_agent.propose(
         decision="Should we launch this week?",
         context="All systems stable, rollback plan ready, deployment scripts tested",
         context_analysis=context_analysis
@@ -91,15 +90,14 @@ def test_proposer_with_high_completeness():
 
     # With high completeness, confidence should be reasonably high
     # (though not necessarily >50, depends on LLM's assessment)
-    print(f"\n[PASS] Test passed: Proposer with high completeness")
-    print(f"  Recommendation: {result.recommendation}")
-    print(f"  Assumptions: {len(result.assumptions)}")
-    print(f"  Confidence: {result.confidence}")
+    logger.debug("[PASS] Test passed: Proposer with high completeness")
+    logger.debug("Recommendation: %s", result.recommendation)
+    logger.debug("Assumptions: %s", len(result.assumptions))
+    logger.debug("Confidence: %s", result.confidence)
 
 
-def test_proposer_output_consistency():
+def test_proposer_output_consistency(proposer_agent):
     """Test that same input produces consistent output structure."""
-    agent = ProposerAgent()
 
     context_analysis = ContextAnalysis(
         decision_type="technical",
@@ -110,31 +108,54 @@ def test_proposer_output_consistency():
     )
 
     # Run twice
-    result1 = agent.propose(
+    result1 = proposer_agent.propose(
         decision="Should we refactor the auth module?",
         context="Need better performance",
         context_analysis=context_analysis
     )
 
-    result2 = agent.propose(
+    result2 = proposer_agent.propose(
         decision="Should we refactor the auth module?",
         context="Need better performance",
         context_analysis=context_analysis
     )
 
-    # Both should have required fields
-    for result in [result1, result2]:
-        assert hasattr(result, 'recommendation')
-        assert hasattr(result, 'assumptions')
-        assert hasattr(result, 'confidence')
-        assert hasattr(result, 'justification')
+    # Both should have required fields (guaranteed by schema validation)
+    assert isinstance(result1, ProposerOutput)
+    assert isinstance(result2, ProposerOutput)
+
+    logger.debug("[PASS] Test passed: Output consistency")
+
+
+def test_proposer_reuses_seeded_output(proposer_agent):
+    """Test that with OPENAI_SEED set, an identical repeat call is served without a new LLM call."""
+    if "seed" not in proposer_agent.sampling_params:
+        pytest.skip("OPENAI_SEED not set")
+
+    context_analysis = ContextAnalysis(
+        decision_type="launch",
+        required_context=["deployment readiness", "rollback plan"],
+        provided_context=["deployment readiness"],
+        missing_context=["rollback plan"],
+        completeness_score=50
+    )
+
+    first = proposer_agent.propose(
+        decision="Should we ship the mobile release on Monday?",
+        context="QA sign-off done",
+        context_analysis=context_analysis
+    )
+    second = proposer_agent.propose(
+        decision="Should we ship the mobile release on Monday?",
+        context="QA sign-off done",
+        context_analysis=context_analysis
+    )
 
-    print(f"\n[PASS] Test passed: Output consistency")
+    assert second is first
 
 
-def test_proposer_evaluative_language():
+def test_proposer_evaluative_language(proposer_agent):
     """Test that proposer uses evaluative language, not conversational."""
-    agent = ProposerAgent()
 
     context_analysis = ContextAnalysis(
         decision_type="pricing",
@@ -144,7 +165,7 @@ def test_proposer_evaluative_language():
         completeness_score=0
     )
 
-    result = agent.propose(
+    result = proposer_agent.propose(
         decision="Should we increase pricing by 20%?",
         context="",
         context_analysis=context_analysis
@@ -162,16 +183,9 @@ def test_proposer_evaluative_language():
     # Should be structured and evaluative
     assert len(result.justification) > 20, "Justification should be substantive"
 
-    print(f"\n[PASS] Test passed: Evaluative language")
-    print(f"  Justification: {result.justification[:100]}...")
+    logger.debug("[PASS] Test passed: Evaluative language")
+    logger.debug("Justification: %s...", result.justification[:100])
 
 
 if __name__ == "__main__":
-    print("Running Proposer Agent tests...\n")
-
-    test_proposer_with_low_completeness()
-    test_proposer_with_high_completeness()
-    test_proposer_output_consistency()
-    test_proposer_evaluative_language()
-
-    print("\n[SUCCESS] All Proposer Agent tests passed!")
+    sys.exit(pytest.main([__file__, "-q"]))
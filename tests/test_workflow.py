@@ -1,17 +1,21 @@
 """Tests for LangGraph workflow orchestration."""
+import logging
 import sys
-import os
 
-# Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
 
-from src.services.workflow import DecisionWorkflow
+from src.models.schemas import (
+    DecisionInput, ContextAnalysis, ProposerOutput, DevilsAdvocateOutput, JudgeOutput, ConfidenceOutput
+)
 
+logger = logging.getLogger(__name__)
 
-def test_workflow_end_to_end():
-    """Test that workflow executes both agents in sequence."""
-    workflow = DecisionWorkflow()
 
+# Integration check against the real agents (the session workflow under --run-live);
+# the tests below run on the FakeLLM-backed workflow by default
+@pytest.mark.live
+def test_workflow_end_to_end(workflow):
+    """Test that workflow executes both agents in sequence."""
     result = workflow.run(
         decision="Should we launch the new feature next week?",
         context="Team is ready and tests are passing"
@@ -29,48 +33,25 @@ def test_workflow_end_to_end():
 
     # Verify context analysis
     context_analysis = result["context_analysis"]
-    assert context_analysis is not None
-    assert hasattr(context_analysis, 'decision_type')
-    assert hasattr(context_analysis, 'completeness_score')
-    assert hasattr(context_analysis, 'required_context')
-    assert hasattr(context_analysis, 'provided_context')
-    assert hasattr(context_analysis, 'missing_context')
+    assert isinstance(context_analysis, ContextAnalysis)
 
     # Verify proposer output
     proposer_output = result["proposer_output"]
-    assert proposer_output is not None
-    assert hasattr(proposer_output, 'recommendation')
-    assert hasattr(proposer_output, 'assumptions')
-    assert hasattr(proposer_output, 'confidence')
-    assert hasattr(proposer_output, 'justification')
+    assert isinstance(proposer_output, ProposerOutput)
 
     # Verify devil's advocate output
     devils_advocate_output = result["devils_advocate_output"]
-    assert devils_advocate_output is not None
-    assert hasattr(devils_advocate_output, 'counterarguments')
-    assert hasattr(devils_advocate_output, 'failure_scenarios')
-    assert hasattr(devils_advocate_output, 'high_risk_assumptions')
-    assert hasattr(devils_advocate_output, 'risk_breakdown')
+    assert isinstance(devils_advocate_output, DevilsAdvocateOutput)
 
     # Verify judge output
     judge_output = result["judge_output"]
-    assert judge_output is not None
-    assert hasattr(judge_output, 'proposer_strength')
-    assert hasattr(judge_output, 'advocate_strength')
-    assert hasattr(judge_output, 'weak_claims')
-    assert hasattr(judge_output, 'unsupported_claims')
-    assert hasattr(judge_output, 'reasoning_assessment')
+    assert isinstance(judge_output, JudgeOutput)
     assert 0 <= judge_output.proposer_strength <= 10
     assert 0 <= judge_output.advocate_strength <= 10
 
     # Verify confidence output
     confidence_output = result["confidence_output"]
-    assert confidence_output is not None
-    assert hasattr(confidence_output, 'initial_confidence')
-    assert hasattr(confidence_output, 'adjusted_confidence')
-    assert hasattr(confidence_output, 'delta')
-    assert hasattr(confidence_output, 'penalties')
-    assert hasattr(confidence_output, 'improvements')
+    assert isinstance(confidence_output, ConfidenceOutput)
     assert 0 <= confidence_output.initial_confidence <= 100
     assert 0 <= confidence_output.adjusted_confidence <= 100
 
@@ -80,23 +61,21 @@ def test_workflow_end_to_end():
     assert isinstance(final_recommendation, str)
     assert any(keyword in final_recommendation for keyword in ["PROCEED", "CONDITIONAL", "DELAY"])
 
-    print(f"\n[PASS] Workflow end-to-end test passed")
-    print(f"  Decision Type: {context_analysis.decision_type}")
-    print(f"  Completeness: {context_analysis.completeness_score}%")
-    print(f"  Recommendation: {proposer_output.recommendation}")
-    print(f"  Initial Confidence: {proposer_output.confidence}")
-    print(f"  Counterarguments: {len(devils_advocate_output.counterarguments)}")
-    print(f"  Risk Breakdown: exec={devils_advocate_output.risk_breakdown.execution}, market={devils_advocate_output.risk_breakdown.market_customer}")
-    print(f"  Proposer Strength: {judge_output.proposer_strength}/10, Advocate Strength: {judge_output.advocate_strength}/10")
-    print(f"  Adjusted Confidence: {confidence_output.adjusted_confidence}% (delta: {confidence_output.delta})")
-    print(f"  Penalties Applied: {len(confidence_output.penalties)}")
-    print(f"  Final Recommendation: {final_recommendation.split(chr(10))[0]}")
+    logger.debug("[PASS] Workflow end-to-end test passed")
+    logger.debug("Decision Type: %s", context_analysis.decision_type)
+    logger.debug("Completeness: %s%%", context_analysis.completeness_score)
+    logger.debug("Recommendation: %s", proposer_output.recommendation)
+    logger.debug("Initial Confidence: %s", proposer_output.confidence)
+    logger.debug("Counterarguments: %s", len(devils_advocate_output.counterarguments))
+    logger.debug("Risk Breakdown: exec=%s, market=%s", devils_advocate_output.risk_breakdown.execution, devils_advocate_output.risk_breakdown.market_customer)
+    logger.debug("Proposer Strength: %s/10, Advocate Strength: %s/10", judge_output.proposer_strength, judge_output.advocate_strength)
+    logger.debug("Adjusted Confidence: %s%% (delta: %s)", confidence_output.adjusted_confidence, confidence_output.delta)
+    logger.debug("Penalties Applied: %s", len(confidence_output.penalties))
+    logger.debug("Final Recommendation: %s", final_recommendation.split(chr(10))[0])
 
 
-def test_workflow_with_no_context():
+def test_workflow_with_no_context(workflow):
     """Test workflow when no context is provided."""
-    workflow = DecisionWorkflow()
-
     result = workflow.run(
         decision="Should we hire a senior engineer?",
         context=None
@@ -114,15 +93,13 @@ def test_workflow_with_no_context():
     proposer_output = result["proposer_output"]
     assert len(proposer_output.assumptions) > 0, "No context should generate assumptions"
 
-    print(f"\n[PASS] Workflow with no context test passed")
-    print(f"  Completeness: {context_analysis.completeness_score}%")
-    print(f"  Assumptions: {len(proposer_output.assumptions)}")
+    logger.debug("[PASS] Workflow with no context test passed")
+    logger.debug("Completeness: %s%%", context_analysis.completeness_score)
+    logger.debug("Assumptions: %s", len(proposer_output.assumptions))
 
 
-def test_workflow_sequential_execution():
+def test_workflow_sequential_execution(workflow):
     """Test that context analysis output feeds into proposer."""
-    workflow = DecisionWorkflow()
-
     result = workflow.run(
         decision="Should we change our pricing model?",
         context="Current MRR is $50k"
@@ -142,14 +119,26 @@ def test_workflow_sequential_execution():
         # Low completeness should mean more assumptions
         assert len(proposer_output.assumptions) >= 2
 
-    print(f"\n[PASS] Sequential execution test passed")
+    logger.debug("[PASS] Sequential execution test passed")
 
 
-if __name__ == "__main__":
-    print("Running Workflow tests...\n")
+def test_workflow_run_batch(workflow):
+    """Test that run_batch evaluates every decision and keeps input order."""
+    decisions = [
+        DecisionInput(decision="Should we launch the new feature next week?", context="Tests are passing"),
+        DecisionInput(decision="Should we change our pricing model?", context="Current MRR is $50k"),
+        DecisionInput(decision="Should we hire a second SRE?"),
+    ]
+
+    results = workflow.run_batch(decisions)
 
-    test_workflow_end_to_end()
-    test_workflow_with_no_context()
-    test_workflow_sequential_execution()
+    assert [r["decision"] for r in results] == [d.decision for d in decisions]
+    assert [r["context"] for r in results] == [d.context for d in decisions]
+    for result in results:
+        assert result["confidence_output"] is not None
+        assert result["final_recommendation"]
+    assert workflow.run_batch([]) == []
 
-    print("\n[SUCCESS] All Workflow tests passed!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))